@@ -1,23 +1,100 @@
 from fastapi import FastAPI, Request, Form, File, UploadFile
-from fastapi.responses import HTMLResponse, JSONResponse
+from fastapi.responses import HTMLResponse, ORJSONResponse, Response
 from fastapi.templating import Jinja2Templates
 from fastapi.staticfiles import StaticFiles
 import os
-import json
 import re
+import asyncio
+import codecs
+import time
+from collections import OrderedDict, deque
+from contextlib import asynccontextmanager
 from datetime import datetime
 from typing import List, Optional
+import httpx
+import orjson
 from dotenv import load_dotenv
-from twilio.rest import Client
-from twilio.twiml.voice_response import VoiceResponse
-import google.generativeai as genai
-from openai import OpenAI
+from xml.sax.saxutils import escape, quoteattr
+from openai import AsyncOpenAI
 from pathlib import Path
 
+# Precompiled regex patterns used on the per-call paths
+_ANSI_RE = re.compile(r'\x1B(?:[@-Z\\-_]|\[[0-?]*[ -/]*[@-~])')
+# ANSI codes, bare "[0m" remnants, the "More information" trailer and a
+# trailing URL, removed together in a single pass over Twilio error text
+_ERROR_CLEAN_RE = re.compile(
+    r'\x1B(?:[@-Z\\-_]|\[[0-?]*[ -/]*[@-~])'
+    r'|\[[0-9;]*m'
+    r'|More information may be available here:.*$'
+    r'|https?://\S+\s*$',
+    re.DOTALL
+)
+_UNABLE_TO_CREATE_RE = re.compile(r'Unable to create record:.*?(?=More information may be available|$)', re.DOTALL)
+_WHITESPACE_RE = re.compile(r'\s+')
+_SPLIT_RE = re.compile(r'[,\n\r]+')
+_PHONE_RE = re.compile(r'\d{10,}')
+_PHONE_IN_ERROR_RE = re.compile(r'\+?\d{10,}')
+_JSON_OBJ_RE = re.compile(r'\{[^}]+\}')
+# "call ... <number>" anywhere in a prompt, and words that negate a command
+_CALL_THEN_NUMBER_RE = re.compile(r'\b(?:call|dial)\b.*?(\d{10,})', re.IGNORECASE | re.DOTALL)
+_NEGATION_RE = re.compile(r"\b(?:don'?t|do not|never|except|not)\b", re.IGNORECASE)
+# A command that is nothing but "call"/"dial" followed by a single number
+_CALL_NUMBER_CMD_RE = re.compile(r'^\s*(?:please\s+)?(?:call|dial)\s+(\+?[\d\s()-]{10,})\s*$', re.IGNORECASE)
+
+class _KeepOnlyTable(dict):
+    """str.translate table that keeps the given characters and deletes all others"""
+
+    def __init__(self, keep: str):
+        # Prefill ASCII so the common case never falls through to __missing__
+        super().__init__((c, c if chr(c) in keep else None) for c in range(128))
+
+    def __missing__(self, key):
+        return None
+
+# Translation tables used instead of regex substitution for number cleanup
+_KEEP_DIGITS_PLUS = _KeepOnlyTable('0123456789+')
+_KEEP_DIGITS = _KeepOnlyTable('0123456789')
+
 # Load environment variables
 load_dotenv()
 
-app = FastAPI()
+# Shared HTTP client for outbound API requests (created in lifespan)
+http_client: Optional[httpx.AsyncClient] = None
+HTTP_MAX_CONNECTIONS = 50
+# Caps in-flight Twilio calls at the pool size, so large batches queue here
+# instead of timing out while waiting for a pooled connection
+_twilio_call_semaphore = asyncio.Semaphore(HTTP_MAX_CONNECTIONS)
+# Batcher that coalesces concurrent /call submissions (created in lifespan)
+call_batcher = None
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Create the shared HTTP client, call batcher and background tasks on startup, stop them on shutdown"""
+    global http_client, call_batcher
+    # One keep-alive pool for all outbound requests, so repeated Twilio
+    # calls reuse connections instead of doing a TLS handshake each time
+    http_client = httpx.AsyncClient(
+        http2=False,
+        limits=httpx.Limits(max_keepalive_connections=20, max_connections=HTTP_MAX_CONNECTIONS, keepalive_expiry=30),
+        timeout=httpx.Timeout(15.0, connect=5.0)
+    )
+    call_batcher = CallBatcher(max_batch_size=32, max_delay=0.2)
+    cache_clear_task = asyncio.create_task(clear_ai_command_cache_loop())
+    # Load verified numbers up front so no request has to fetch them
+    if twilio_configured:
+        await refresh_verified_cache_quietly()
+    verified_refresh_task = asyncio.create_task(refresh_verified_loop())
+    try:
+        yield
+    finally:
+        verified_refresh_task.cancel()
+        cache_clear_task.cancel()
+        await call_batcher.close()
+        call_batcher = None
+        await http_client.aclose()
+        http_client = None
+
+app = FastAPI(lifespan=lifespan, default_response_class=ORJSONResponse)
 
 # Mount static files and templates
 app.mount("/static", StaticFiles(directory="static"), name="static")
@@ -26,195 +103,382 @@ templates = Jinja2Templates(directory="templates")
 # Function to strip ANSI codes from text
 def strip_ansi_codes(text: str) -> str:
     """Remove ANSI escape codes from text"""
-    import re
     # Remove ANSI escape sequences
-    ansi_escape = re.compile(r'\x1B(?:[@-Z\\-_]|\[[0-?]*[ -/]*[@-~])')
-    return ansi_escape.sub('', str(text))
+    return _ANSI_RE.sub('', str(text))
 
 # Jinja2 filter will be registered after clean_error_message is defined
 
-# Initialize Twilio client
+# Twilio configuration (requests go straight to the REST API)
 TWILIO_ACCOUNT_SID = os.getenv("TWILIO_ACCOUNT_SID")
 TWILIO_AUTH_TOKEN = os.getenv("TWILIO_AUTH_TOKEN")
 TWILIO_PHONE_NUMBER = os.getenv("TWILIO_PHONE_NUMBER")
+TWILIO_API_HOST = "https://api.twilio.com"
 
-twilio_client = None
-if TWILIO_ACCOUNT_SID and TWILIO_AUTH_TOKEN:
-    twilio_client = Client(TWILIO_ACCOUNT_SID, TWILIO_AUTH_TOKEN)
+twilio_configured = bool(TWILIO_ACCOUNT_SID and TWILIO_AUTH_TOKEN)
+
+def twilio_url(path: str) -> str:
+    """Build a Twilio REST API URL for a path under the account"""
+    return f"{TWILIO_API_HOST}/2010-04-01/Accounts/{TWILIO_ACCOUNT_SID}/{path}"
+
+async def twilio_request(method: str, url: str, **kwargs) -> dict:
+    """Send an authenticated request to Twilio and return the JSON payload"""
+    resp = await http_client.request(method, url, auth=(TWILIO_ACCOUNT_SID, TWILIO_AUTH_TOKEN), **kwargs)
+    if resp.status_code >= 400:
+        # Mirror the SDK's wording so error cleanup and guidance keep working
+        action = "create record" if method == "POST" else "fetch page"
+        message = None
+        if resp.headers.get("content-type", "").startswith("application/json"):
+            try:
+                message = orjson.loads(resp.content).get("message")
+            except (ValueError, AttributeError):
+                pass
+        if not message:
+            # Non-JSON errors (e.g. a proxy's 503 page) keep the status and body
+            message = f"HTTP {resp.status_code}: {resp.text.strip()}"
+        raise Exception(f"Unable to {action}: {message}")
+    return orjson.loads(resp.content) if resp.content else {}
+
+async def twilio_post(path: str, data: dict) -> dict:
+    """POST form data to a Twilio account resource"""
+    return await twilio_request("POST", twilio_url(path), data=data)
+
+async def twilio_get(path: str, params: Optional[dict] = None) -> dict:
+    """GET a Twilio account resource"""
+    return await twilio_request("GET", twilio_url(path), params=params)
 
 # Initialize AI (prefer Gemini, fallback to OpenAI)
 GEMINI_API_KEY = os.getenv("GEMINI_API_KEY")
 OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
 
+GEMINI_GENERATE_URL = "https://generativelanguage.googleapis.com/v1beta/models/gemini-pro:generateContent"
+
 openai_client = None
 if GEMINI_API_KEY:
-    genai.configure(api_key=GEMINI_API_KEY)
-    ai_model = genai.GenerativeModel('gemini-pro')
+    # Gemini is called over the shared HTTP client, no SDK needed
     ai_provider = "gemini"
 elif OPENAI_API_KEY:
-    openai_client = OpenAI(api_key=OPENAI_API_KEY)
+    openai_client = AsyncOpenAI(api_key=OPENAI_API_KEY)
     ai_provider = "openai"
 else:
     ai_provider = None
 
-# Call logs file
+# Call logs file (append-only JSON Lines, one record per line)
+CALLS_JSONL = "calls.jsonl"
+# Compacted JSON snapshot, only written on request
 CALLS_JSON = "calls.json"
+# Maximum number of log entries kept in memory
+MAX_CALL_LOGS_IN_MEMORY = 100_000
+
+def read_call_log_file():
+    """Read all call logs from the JSONL file"""
+    logs = []
+    if os.path.exists(CALLS_JSONL):
+        with open(CALLS_JSONL, 'rb') as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    logs.append(orjson.loads(line))
+                except ValueError:
+                    # Skip a partially written trailing record
+                    continue
+    return logs
 
 def load_call_logs():
-    """Load call logs from JSON file"""
-    if os.path.exists(CALLS_JSON):
-        with open(CALLS_JSON, 'r') as f:
-            try:
-                return json.load(f)
-            except:
-                return []
-    return []
+    """Return a snapshot of the in-memory call logs"""
+    return list(CALL_LOGS)
 
-def save_call_log(call_data):
-    """Save a call log entry"""
-    logs = load_call_logs()
-    logs.append(call_data)
-    with open(CALLS_JSON, 'w') as f:
-        json.dump(logs, f, indent=2)
+def _append_and_sync(data: bytes):
+    """Append raw JSONL bytes to the log file and fsync once"""
+    with open(CALLS_JSONL, 'ab') as f:
+        f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+
+async def save_call_logs_many(entries):
+    """Append several call log entries with a single write and a single fsync"""
+    if not entries:
+        return
+    global CALL_LOGS_VERSION
+    data = b''.join(orjson.dumps(e) + b'\n' for e in entries)
+    async with _call_log_lock:
+        # fsync can stall for milliseconds, keep it off the event loop
+        await asyncio.to_thread(_append_and_sync, data)
+        CALL_LOGS.extend(entries)
+        CALL_LOGS_VERSION += 1
+
+async def save_call_log(call_data):
+    """Append a call log entry"""
+    await save_call_logs_many([call_data])
+
+def rewrite_call_logs(logs):
+    """Replace the JSONL log with the given entries"""
+    tmp_path = CALLS_JSONL + '.tmp'
+    with open(tmp_path, 'wb', buffering=1 << 16) as f:
+        f.writelines(orjson.dumps(e) + b'\n' for e in logs)
+    os.replace(tmp_path, CALLS_JSONL)
+
+def compact_call_logs():
+    """Write the JSONL log out as a single calls.json snapshot"""
+    logs = read_call_log_file()
+    with open(CALLS_JSON, 'wb') as f:
+        f.write(orjson.dumps(logs, option=orjson.OPT_INDENT_2))
+    return len(logs)
+
+def migrate_legacy_logs():
+    """Convert a legacy calls.json array into calls.jsonl on first run"""
+    if os.path.exists(CALLS_JSONL) or not os.path.exists(CALLS_JSON):
+        return
+    with open(CALLS_JSON, 'rb') as f:
+        try:
+            logs = orjson.loads(f.read())
+        except ValueError:
+            return
+    if isinstance(logs, list):
+        rewrite_call_logs(logs)
+
+migrate_legacy_logs()
+
+# In-memory copy of the call log so reads never touch the file; the lock keeps
+# concurrent appends from interleaving in the JSONL file
+CALL_LOGS = deque(read_call_log_file(), maxlen=MAX_CALL_LOGS_IN_MEMORY)
+_call_log_lock = asyncio.Lock()
+# Bumped on every change to CALL_LOGS; seeded from the clock so ETags
+# handed out by a previous run never match
+CALL_LOGS_VERSION = time.time_ns()
+
+def call_logs_etag() -> str:
+    """Weak ETag identifying the current state of the call logs"""
+    return f'W/"{CALL_LOGS_VERSION}-{len(CALL_LOGS)}"'
+
+def etag_matches(request: Request, etag: str) -> bool:
+    """Check whether the client already holds the given ETag"""
+    if_none_match = request.headers.get("if-none-match")
+    if not if_none_match:
+        return False
+    return etag in (tag.strip() for tag in if_none_match.split(","))
 
 def clean_error_message(error_text):
     """Clean error message by removing ANSI codes and extracting core message"""
     if not error_text:
         return error_text
     
-    # First strip ANSI codes
-    cleaned = strip_ansi_codes(str(error_text))
+    text = str(error_text)
     
     # If it's a verbose Twilio error, extract just the core message
-    if "Twilio returned the following information:" in cleaned:
-        parts = cleaned.split("Twilio returned the following information:")
-        if len(parts) > 1:
-            error_msg = parts[1].strip()
-            # Remove any remaining ANSI-like codes
-            error_msg = re.sub(r'\[[0-9;]*m', '', error_msg)
-            # Remove "More information may be available here" and URL
-            error_msg = re.sub(r'More information may be available here:.*$', '', error_msg, flags=re.DOTALL)
-            error_msg = error_msg.strip()
-            # Remove URL if present
-            error_msg = re.sub(r'https?://[^\s]+$', '', error_msg).strip()
-            return error_msg
+    _, found, details = text.partition("Twilio returned the following information:")
+    if found:
+        # Strip ANSI codes, the "More information" trailer and URL in one pass
+        return _ERROR_CLEAN_RE.sub('', details).strip()
+    
+    # Otherwise just strip ANSI codes
+    cleaned = strip_ansi_codes(text)
     
     # Also handle cases where error starts with "HTTP Error" but has the core message
     if "HTTP Error" in cleaned and "Unable to create record:" in cleaned:
         # Extract the complete error message starting from "Unable to create record:"
-        match = re.search(r'Unable to create record:.*?(?=More information may be available|$)', cleaned, re.DOTALL)
+        match = _UNABLE_TO_CREATE_RE.search(cleaned)
         if match:
             error_msg = match.group(0).strip()
             # Clean up any extra whitespace
-            error_msg = re.sub(r'\s+', ' ', error_msg)
+            error_msg = _WHITESPACE_RE.sub(' ', error_msg)
             return error_msg
     
     return cleaned
 
-def cleanup_all_logs():
-    """Clean up all error messages in existing logs"""
-    logs = load_call_logs()
+def _cleanup_log_file():
+    """Clean error messages in the JSONL file and rewrite it (blocking)"""
+    logs = read_call_log_file()
     cleaned_logs = []
     for log in logs:
         if 'error' in log and log['error']:
             log['error'] = clean_error_message(log['error'])
+            log['error_clean'] = True
         cleaned_logs.append(log)
     
     # Save cleaned logs
-    with open(CALLS_JSON, 'w') as f:
-        json.dump(cleaned_logs, f, indent=2)
+    rewrite_call_logs(cleaned_logs)
+    return cleaned_logs
+
+async def cleanup_all_logs():
+    """Clean up all error messages in existing logs"""
+    global CALL_LOGS_VERSION
+    async with _call_log_lock:
+        # The lock keeps appends out of the rewrite; the file work itself
+        # runs in a thread so the event loop keeps serving requests
+        cleaned_logs = await asyncio.to_thread(_cleanup_log_file)
+        CALL_LOGS.clear()
+        CALL_LOGS.extend(cleaned_logs)
+        CALL_LOGS_VERSION += 1
     
     return len(cleaned_logs)
 
 # Register Jinja2 filter for cleaning ANSI codes (after clean_error_message is defined)
-def clean_ansi(text):
-    """Jinja2 filter to remove ANSI codes and extract core error messages"""
+def clean_ansi(text, already_clean=False):
+    """Jinja2 filter to remove ANSI codes and extract core error messages
+
+    Entries saved with "error_clean" set were cleaned when written, so the
+    filter passes them through untouched.
+    """
+    if not text or already_clean:
+        return text
     return clean_error_message(text)
 
 templates.env.filters["clean_ansi"] = clean_ansi
 
-def get_verified_numbers():
-    """Get list of verified phone numbers from Twilio"""
+async def fetch_verified_numbers() -> List[str]:
+    """Fetch every verified caller ID from Twilio, following pagination"""
     verified_numbers = []
-    if twilio_client:
-        try:
-            verified_list = twilio_client.outgoing_caller_ids.list()
-            verified_numbers = [str(v.phone_number) for v in verified_list]
-        except:
-            pass
+    payload = await twilio_get("OutgoingCallerIds.json", {"PageSize": 1000})
+    while True:
+        verified_numbers.extend(str(v["phone_number"]) for v in payload.get("outgoing_caller_ids", []))
+        next_page_uri = payload.get("next_page_uri")
+        if not next_page_uri:
+            break
+        payload = await twilio_request("GET", TWILIO_API_HOST + next_page_uri)
     return verified_numbers
 
-def parse_phone_numbers(text: str) -> List[str]:
-    """Parse phone numbers from text (comma or newline separated) and format to E.164"""
-    # Get verified numbers to help with country code detection
-    verified_numbers = get_verified_numbers()
-    verified_digits = {}
+# Verified numbers with the last-10-digits -> E.164 lookup map, loaded at
+# startup and refreshed in the background so requests never wait on Twilio
+VERIFIED_REFRESH_INTERVAL = 300
+# "error" holds the last refresh failure, cleared by the next successful refresh
+_verified_cache = {"numbers": [], "digit_map": {}, "digit_set": frozenset(), "error": None}
+
+def build_verified_digit_map(verified_numbers: List[str]) -> dict:
+    """Map the last 10 digits of each verified number to its full format"""
+    digit_map = {}
     for v in verified_numbers:
         # Normalize: remove all non-digits except +
-        digits = re.sub(r'[^\d+]', '', v)
+        digits = v.translate(_KEEP_DIGITS_PLUS)
         # Store mapping of last 10 digits to full number
         if len(digits) >= 10:
             last_10 = digits[-10:]
-            verified_digits[last_10] = v.replace(' ', '').replace('-', '')
+            digit_map[last_10] = v.replace(' ', '').replace('-', '')
+    return digit_map
+
+async def refresh_verified_cache() -> dict:
+    """Refetch verified numbers from Twilio
+
+    On failure the old list is kept, the error is recorded in the cache and
+    the exception is re-raised so callers can report it.
+    """
+    if not twilio_configured or not http_client:
+        raise RuntimeError("Twilio credentials not configured")
+    try:
+        verified_numbers = await fetch_verified_numbers()
+    except Exception as e:
+        _verified_cache["error"] = str(e) or type(e).__name__
+        raise
+    digit_map = build_verified_digit_map(verified_numbers)
+    _verified_cache["numbers"] = verified_numbers
+    _verified_cache["digit_map"] = digit_map
+    _verified_cache["digit_set"] = frozenset(digit_map)
+    _verified_cache["error"] = None
+    return _verified_cache
+
+async def refresh_verified_cache_quietly():
+    """Refresh verified numbers in the background, logging any failure"""
+    try:
+        await refresh_verified_cache()
+    except Exception as e:
+        print(f"Verified numbers refresh error: {e}")
+
+async def refresh_verified_loop(interval: float = VERIFIED_REFRESH_INTERVAL):
+    """Keep the verified numbers cache fresh in the background"""
+    while True:
+        await asyncio.sleep(interval)
+        await refresh_verified_cache_quietly()
+
+# Country code assumed for 10-digit numbers that don't match a verified number
+DEFAULT_COUNTRY_CODES = {
+    "10_digit": "+1",  # US/Canada
+}
+
+# Formatting rules for numbers entered without a leading +, keyed by
+# (length, first digit); '_' matches any first digit for that length
+_FORMAT_RULES = {
+    # 10 digits: use the verified number's format if the last 10 digits match
+    (10, '_'): lambda n, ds, dm: dm[n] if n in ds else DEFAULT_COUNTRY_CODES["10_digit"] + n,
+    # 11 digits starting with 1 already carry the US/Canada code
+    (11, '1'): lambda n, ds, dm: '+' + n,
+}
+
+def format_phone_number(num: str, digit_set: frozenset, digit_map: dict) -> Optional[str]:
+    """Clean a single raw number and format it to E.164, or return None if invalid"""
+    # Remove all non-digit characters except +
+    num_clean = num.strip().translate(_KEEP_DIGITS_PLUS)
+    
+    if not num_clean:
+        return None
+    
+    # If number doesn't start with +, try to determine country code
+    if num_clean[0] != '+':
+        length = len(num_clean)
+        rule = _FORMAT_RULES.get((length, num_clean[0])) or _FORMAT_RULES.get((length, '_'))
+        # For other lengths, add + prefix
+        num_clean = rule(num_clean, digit_set, digit_map) if rule else '+' + num_clean
+    
+    # Validate: should be at least 10 digits after country code
+    digits_only = num_clean.translate(_KEEP_DIGITS)
+    if len(digits_only) >= 10:
+        return num_clean
+    return None
+
+def parse_phone_numbers(text: str) -> List[str]:
+    """Parse phone numbers from text (comma or newline separated) and format to E.164
+    """
+    # Get verified numbers to help with country code detection
+    digit_set = _verified_cache["digit_set"]
+    digit_map = _verified_cache["digit_map"]
     
     # Remove whitespace and split by comma or newline
-    numbers = re.split(r'[,\n\r]+', text)
+    numbers = _SPLIT_RE.split(text)
     # Clean and filter valid numbers
     cleaned = []
     for num in numbers:
-        # Remove all non-digit characters except +
-        num_clean = re.sub(r'[^\d+]', '', num.strip())
-        
-        if not num_clean:
-            continue
-        
-        original_num = num_clean
-        
-        # If number doesn't start with +, try to determine country code
-        if not num_clean.startswith('+'):
-            # Check if this matches a verified number (last 10 digits)
-            if len(num_clean) == 10:
-                if num_clean in verified_digits:
-                    # Use the verified number's format
-                    num_clean = verified_digits[num_clean]
-                else:
-                    # Default to US/Canada for 10-digit numbers
-                    num_clean = '+1' + num_clean
-            # If it's 11 digits and starts with 1, add +
-            elif len(num_clean) == 11 and num_clean.startswith('1'):
-                num_clean = '+' + num_clean
-            # For Indian numbers: 10 digits starting with 9 (common pattern)
-            elif len(num_clean) == 10 and num_clean.startswith('9'):
-                # Check if it matches a verified number
-                if num_clean in verified_digits:
-                    num_clean = verified_digits[num_clean]
-                else:
-                    # Try +91 for India (most common)
-                    num_clean = '+91' + num_clean
-            # For other lengths, add + prefix
-            else:
-                num_clean = '+' + num_clean
-        
-        # Validate: should be at least 10 digits after country code
-        digits_only = re.sub(r'[^\d]', '', num_clean)
-        if len(digits_only) >= 10:
+        num_clean = format_phone_number(num, digit_set, digit_map)
+        if num_clean:
             cleaned.append(num_clean)
     
     return cleaned
 
-def parse_ai_command(prompt: str) -> dict:
-    """Parse AI command using Gemini or OpenAI"""
-    if not ai_provider:
-        # Fallback to simple regex parsing
-        if "call" in prompt.lower() and any(char.isdigit() for char in prompt):
-            numbers = re.findall(r'\d{10,}', prompt)
-            if numbers:
-                return {"action": "call_single", "number": numbers[0]}
-        if "start calling" in prompt.lower() or "call all" in prompt.lower():
-            return {"action": "call_all"}
-        return {"action": "unknown", "error": "Could not parse command"}
-    
-    system_prompt = """You are a command parser for a DialAI app. 
+UPLOAD_CHUNK_SIZE = 65536
+# Longest unseparated run kept while streaming; anything longer is not a number
+MAX_NUMBER_TOKEN_LENGTH = 256
+
+async def parse_phone_numbers_stream(file: UploadFile):
+    """Parse phone numbers from an uploaded file chunk by chunk, yielding E.164 numbers
+
+    Numbers are yielded as soon as their separator is read, so callers can
+    start dialing before the whole upload has been consumed. Runs longer than
+    MAX_NUMBER_TOKEN_LENGTH without a separator are skipped rather than buffered.
+    """
+    digit_set = _verified_cache["digit_set"]
+    digit_map = _verified_cache["digit_map"]
+    decoder = codecs.getincrementaldecoder('utf-8')()
+    tail = ''
+    oversized = False
+    while True:
+        chunk = await file.read(UPLOAD_CHUNK_SIZE)
+        final = not chunk
+        # Only split the newly decoded text; the carried tail joins its first part
+        parts = _SPLIT_RE.split(decoder.decode(chunk, final=final))
+        parts[0] = '' if oversized else tail + parts[0]
+        if len(parts) > 1:
+            oversized = False
+        # The last part may be a number cut off mid-chunk, keep it for later
+        tail = '' if final else parts.pop()
+        if len(tail) > MAX_NUMBER_TOKEN_LENGTH:
+            tail, oversized = '', True
+        for num in parts:
+            num_clean = format_phone_number(num, digit_set, digit_map)
+            if num_clean:
+                yield num_clean
+        if final:
+            break
+
+AI_COMMAND_SYSTEM_PROMPT = """You are a command parser for a DialAI app. 
 Parse the user's command and return a JSON object with the action and parameters.
 
 Possible actions:
@@ -233,89 +497,155 @@ User: "Make a call to 1800123456"
 Response: {"action": "call_single", "number": "1800123456"}
 
 Return ONLY valid JSON, no other text."""
+
+# Parsed commands are cached by normalized prompt (LRU) and cleared on this interval
+AI_COMMAND_CACHE_TTL = 600
+AI_COMMAND_CACHE_SIZE = 512
+_ai_command_cache = OrderedDict()
+
+async def _llm_parse_command(prompt: str) -> dict:
+    """Parse a normalized command with the configured LLM
+
+    Raises when the LLM gives no usable answer so failures are not cached.
+    """
+    if ai_provider == "gemini":
+        full_prompt = f"{AI_COMMAND_SYSTEM_PROMPT}\n\nUser command: {prompt}\n\nResponse:"
+        resp = await http_client.post(
+            GEMINI_GENERATE_URL,
+            headers={"x-goog-api-key": GEMINI_API_KEY},
+            json={"contents": [{"parts": [{"text": full_prompt}]}]}
+        )
+        resp.raise_for_status()
+        payload = orjson.loads(resp.content)
+        result_text = payload["candidates"][0]["content"]["parts"][0]["text"].strip()
+    elif ai_provider == "openai" and openai_client:
+        response = await openai_client.chat.completions.create(
+            model="gpt-3.5-turbo",
+            messages=[
+                {"role": "system", "content": AI_COMMAND_SYSTEM_PROMPT},
+                {"role": "user", "content": prompt}
+            ],
+            temperature=0.3
+        )
+        result_text = response.choices[0].message.content.strip()
+    else:
+        raise RuntimeError("No AI provider configured")
     
-    try:
-        if ai_provider == "gemini":
-            full_prompt = f"{system_prompt}\n\nUser command: {prompt}\n\nResponse:"
-            response = ai_model.generate_content(full_prompt)
-            result_text = response.text.strip()
-            # Extract JSON from response
-            json_match = re.search(r'\{[^}]+\}', result_text)
-            if json_match:
-                return json.loads(json_match.group())
-        elif ai_provider == "openai" and openai_client:
-            response = openai_client.chat.completions.create(
-                model="gpt-3.5-turbo",
-                messages=[
-                    {"role": "system", "content": system_prompt},
-                    {"role": "user", "content": prompt}
-                ],
-                temperature=0.3
-            )
-            result_text = response.choices[0].message.content.strip()
-            json_match = re.search(r'\{[^}]+\}', result_text)
-            if json_match:
-                return json.loads(json_match.group())
-    except Exception as e:
-        print(f"AI parsing error: {e}")
-    
-    # Fallback to regex
+    # Extract JSON from response
+    json_match = _JSON_OBJ_RE.search(result_text)
+    if not json_match:
+        raise ValueError(f"No JSON in AI response: {result_text}")
+    return orjson.loads(json_match.group())
+
+async def clear_ai_command_cache_loop(interval: float = AI_COMMAND_CACHE_TTL):
+    """Periodically drop cached command parses so they expire"""
+    while True:
+        await asyncio.sleep(interval)
+        _ai_command_cache.clear()
+
+def _fast_parse(prompt: str) -> Optional[dict]:
+    """Parse only unambiguous commands, or return None to defer to the LLM"""
+    match = _CALL_NUMBER_CMD_RE.match(prompt)
+    if match:
+        number = match.group(1).translate(_KEEP_DIGITS_PLUS)
+        if len(number.translate(_KEEP_DIGITS)) >= 10:
+            return {"action": "call_single", "number": number}
+        return None
+    lowered = prompt.lower()
+    if not any(char.isdigit() for char in prompt) and ("start calling" in lowered or "call all" in lowered):
+        return {"action": "call_all"}
+    return None
+
+def _regex_parse(prompt: str) -> dict:
+    """Lenient keyword parsing, only used when no LLM is configured"""
     if "call" in prompt.lower():
-        numbers = re.findall(r'\d{10,}', prompt)
+        numbers = _PHONE_RE.findall(prompt)
         if numbers:
             return {"action": "call_single", "number": numbers[0]}
     if "start calling" in prompt.lower() or "call all" in prompt.lower():
         return {"action": "call_all"}
-    
     return {"action": "unknown", "error": "Could not parse command"}
 
-def make_twilio_call(phone_number: str) -> dict:
-    """Make a call using Twilio API"""
-    if not twilio_client:
+def _fallback_parse(prompt: str) -> dict:
+    """Best-effort parse when the LLM fails; skips negated call commands"""
+    lowered = prompt.lower()
+    if "start calling" in lowered or "call all" in lowered:
+        return {"action": "call_all"}
+    match = _CALL_THEN_NUMBER_RE.search(prompt)
+    if match and not _NEGATION_RE.search(prompt):
+        return {"action": "call_single", "number": match.group(1)}
+    return {"action": "unknown", "error": "Could not parse command"}
+
+async def parse_ai_command(prompt: str) -> dict:
+    """Parse AI command, only asking Gemini or OpenAI when the cheap parse can't"""
+    fast = _fast_parse(prompt)
+    if fast:
+        return fast
+    
+    if not ai_provider:
+        # Fallback to simple regex parsing
+        return _regex_parse(prompt)
+    
+    try:
+        key = " ".join(prompt.lower().split())
+        parsed = _ai_command_cache.get(key)
+        if parsed is None:
+            parsed = await _llm_parse_command(key)
+            _ai_command_cache[key] = parsed
+            if len(_ai_command_cache) > AI_COMMAND_CACHE_SIZE:
+                _ai_command_cache.popitem(last=False)
+        else:
+            _ai_command_cache.move_to_end(key)
+        return dict(parsed)
+    except Exception as e:
+        print(f"AI parsing error: {e}")
+    
+    # Fallback to regex when the LLM is unreachable or gives no usable answer
+    return _fallback_parse(prompt)
+
+def build_twiml(message: str, voice: str, language: str) -> str:
+    """Build the TwiML document that speaks the message to the receiver"""
+    return (
+        '<?xml version="1.0" encoding="UTF-8"?>'
+        f'<Response><Say voice={quoteattr(voice)} language={quoteattr(language)}>'
+        f'{escape(message)}</Say></Response>'
+    )
+
+async def make_twilio_call_async(phone_number: str) -> dict:
+    """Make a call by posting directly to the Twilio REST API"""
+    if not twilio_configured or not http_client:
         return {
             "success": False,
             "error": "Twilio credentials not configured"
         }
     
     try:
-        # Create TwiML response
-        response = VoiceResponse()
         # Customize the message here - this is what the receiver will hear
         message = os.getenv("CALL_MESSAGE", "Hello, this is a test call from the DialAI app.")
         voice = os.getenv("CALL_VOICE", "alice")  # Options: alice, man, woman, polly.*
         language = os.getenv("CALL_LANGUAGE", "en")  # Language code
         
-        response.say(message, voice=voice, language=language)
+        # Create TwiML response
+        twiml = build_twiml(message, voice, language)
         
         # Make the call
-        call = twilio_client.calls.create(
-            to=phone_number,
-            from_=TWILIO_PHONE_NUMBER,
-            twiml=str(response)
-        )
+        async with _twilio_call_semaphore:
+            payload = await twilio_post("Calls.json", {
+                "To": phone_number,
+                "From": TWILIO_PHONE_NUMBER,
+                "Twiml": twiml
+            })
         
         return {
             "success": True,
-            "call_sid": call.sid,
-            "status": call.status,
+            "call_sid": payload.get("sid"),
+            "status": payload.get("status"),
             "number": phone_number
         }
     except Exception as e:
-        # Clean error message by removing ANSI codes
-        error_msg = strip_ansi_codes(str(e))
-        
-        # Extract the actual error message if it's a Twilio error
-        if "Twilio returned the following information:" in error_msg:
-            # Try to extract the main error message
-            parts = error_msg.split("Twilio returned the following information:")
-            if len(parts) > 1:
-                error_msg = parts[1].strip()
-                # Remove any remaining ANSI-like codes and extra text
-                error_msg = re.sub(r'\[[0-9;]*m', '', error_msg)  # Remove ANSI codes
-                error_msg = re.sub(r'More information may be available here:.*$', '', error_msg, flags=re.DOTALL)
-                error_msg = error_msg.strip()
-                # If there's a URL at the end, remove it
-                error_msg = re.sub(r'https?://[^\s]+$', '', error_msg).strip()
+        # Clean error message by removing ANSI codes and Twilio boilerplate;
+        # some exceptions (e.g. httpx timeouts) have no message at all
+        error_msg = clean_error_message(str(e)) or type(e).__name__
         
         # Add helpful guidance for common errors
         if "not yet verified" in error_msg.lower() or "unverified" in error_msg.lower() or "verified" in error_msg.lower():
@@ -323,7 +653,7 @@ def make_twilio_call(phone_number: str) -> dict:
                 error_msg += " | Fix: Use a Twilio-purchased number in TWILIO_PHONE_NUMBER (Twilio numbers are auto-verified)"
             else:
                 # This is about the destination number (the number you're trying to call)
-                number_match = re.search(r'\+?\d{10,}', error_msg)
+                number_match = _PHONE_IN_ERROR_RE.search(error_msg)
                 if number_match:
                     unverified_num = number_match.group(0)
                     error_msg += f" | Action Required: Verify the DESTINATION number {unverified_num} at https://console.twilio.com/us1/develop/phone-numbers/manage/verified (Trial accounts must verify numbers they want to CALL)"
@@ -336,6 +666,121 @@ def make_twilio_call(phone_number: str) -> dict:
             "number": phone_number
         }
 
+class CallBatcher:
+    """Coalesce concurrent call requests into deduplicated outbound bursts
+
+    Numbers submitted within max_delay seconds of each other (or until
+    max_batch_size numbers are queued) are dialed together, and a number
+    queued by several requests at once is only dialed once.
+    """
+
+    def __init__(self, max_batch_size: int = 32, max_delay: float = 0.2):
+        self.max_batch_size = max_batch_size
+        self.max_delay = max_delay
+        self._pending = []
+        self._timer = None
+        self._tasks = set()
+
+    async def infer(self, numbers: List[str]) -> dict:
+        """Dial each unique number once and return results keyed by number"""
+        unique = list(dict.fromkeys(numbers))
+        results = await asyncio.gather(*(make_twilio_call_async(n) for n in unique))
+        return dict(zip(unique, results))
+
+    async def process_batched(self, number: str) -> dict:
+        """Queue a number for the next burst and wait for its call result"""
+        future = asyncio.get_running_loop().create_future()
+        self._pending.append((number, future))
+        if len(self._pending) >= self.max_batch_size:
+            self._flush()
+        elif self._timer is None:
+            self._timer = asyncio.get_running_loop().call_later(self.max_delay, self._flush)
+        return await future
+
+    def _flush(self):
+        """Hand the queued numbers to a background burst"""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        batch, self._pending = self._pending, []
+        if batch:
+            task = asyncio.create_task(self._run(batch))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _run(self, batch):
+        """Dial a burst and resolve every waiting request"""
+        try:
+            results = await self.infer([number for number, _ in batch])
+        except Exception as e:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        for number, future in batch:
+            if not future.done():
+                future.set_result(results[number])
+
+    async def close(self):
+        """Dial anything still queued and wait for in-flight bursts"""
+        self._flush()
+        if self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+
+# Numbers dialed within this many seconds are skipped instead of redialed
+DEDUPE_TTL = 60
+# Last dial time (monotonic) per number
+RECENT_DIALED = {}
+
+def claim_recent_dial(number: str) -> bool:
+    """Record a dial of number, returning False if it was dialed within DEDUPE_TTL"""
+    now = time.monotonic()
+    last = RECENT_DIALED.get(number)
+    if last is not None and now - last < DEDUPE_TTL:
+        return False
+    RECENT_DIALED[number] = now
+    return True
+
+def prune_recent_dialed():
+    """Forget numbers whose dedupe window has passed"""
+    cutoff = time.monotonic() - DEDUPE_TTL
+    for number in [n for n, t in RECENT_DIALED.items() if t < cutoff]:
+        del RECENT_DIALED[number]
+
+async def call_unless_recent(number: str, call) -> dict:
+    """Place a call with the given dialer unless the number was just dialed"""
+    if not claim_recent_dial(number):
+        return {
+            "success": False,
+            "status": "skipped_duplicate",
+            "error": f"Skipped: {number} was already dialed in the last {DEDUPE_TTL} seconds",
+            "number": number
+        }
+    try:
+        result = await call(number)
+    except Exception:
+        RECENT_DIALED.pop(number, None)
+        raise
+    if not result.get("success"):
+        # Failed calls don't count as dialed, so the user can fix and retry
+        RECENT_DIALED.pop(number, None)
+    return result
+
+def build_call_log(number: str, result: dict) -> dict:
+    """Build a call log entry from a call result"""
+    call_log = {
+        "number": number,
+        "status": result.get("status", "failed"),
+        "success": result.get("success", False),
+        "timestamp": datetime.now().isoformat(),
+        "call_sid": result.get("call_sid"),
+        # Clean once here so the logs page never has to
+        "error": clean_error_message(result.get("error"))
+    }
+    if call_log["error"]:
+        call_log["error_clean"] = True
+    return call_log
+
 @app.get("/", response_class=HTMLResponse)
 async def home(request: Request):
     """Home page with phone number input and AI command"""
@@ -344,8 +789,15 @@ async def home(request: Request):
 @app.get("/logs", response_class=HTMLResponse)
 async def logs_page(request: Request):
     """Display call logs page"""
+    etag = call_logs_etag()
+    if etag_matches(request, etag):
+        # Nothing changed since the client's copy, skip rendering entirely
+        return Response(status_code=304, headers={"ETag": etag})
     logs = load_call_logs()
-    return templates.TemplateResponse("logs.html", {"request": request, "logs": logs})
+    response = templates.TemplateResponse("logs.html", {"request": request, "logs": logs})
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = "private, must-revalidate"
+    return response
 
 @app.post("/call")
 async def initiate_calls(
@@ -354,36 +806,49 @@ async def initiate_calls(
 ):
     """Initiate calls for given phone numbers"""
     phone_numbers = []
+    # Calls are dispatched through the batcher, which coalesces concurrent requests
+    pending_calls = []
+    read_error = None
+    prune_recent_dialed()
     
     # Parse from form or file
     if file and file.filename:
-        content = await file.read()
-        text = content.decode('utf-8')
-        phone_numbers = parse_phone_numbers(text)
+        # Start dialing each number as soon as it is read from the upload
+        seen = set()
+        try:
+            async for number in parse_phone_numbers_stream(file):
+                if number in seen:
+                    continue
+                seen.add(number)
+                phone_numbers.append(number)
+                pending_calls.append(asyncio.ensure_future(call_unless_recent(number, call_batcher.process_batched)))
+        except Exception as e:
+            # Calls already started still finish and get logged below
+            read_error = f"Could not read uploaded file: {e}"
     elif numbers:
-        phone_numbers = parse_phone_numbers(numbers)
+        # Drop repeated numbers, keeping the first occurrence's order
+        phone_numbers = list(dict.fromkeys(parse_phone_numbers(numbers)))
+        pending_calls = [call_unless_recent(n, call_batcher.process_batched) for n in phone_numbers]
     
     if not phone_numbers:
-        return JSONResponse({
+        return ORJSONResponse({
             "success": False,
-            "error": "No valid phone numbers provided"
+            "error": read_error or "No valid phone numbers provided"
         })
     
-    results = []
-    for number in phone_numbers:
-        result = make_twilio_call(number)
-        call_log = {
-            "number": number,
-            "status": result.get("status", "failed"),
-            "success": result.get("success", False),
-            "timestamp": datetime.now().isoformat(),
-            "call_sid": result.get("call_sid"),
-            "error": result.get("error")
-        }
-        save_call_log(call_log)
-        results.append(call_log)
+    call_results = await asyncio.gather(*pending_calls)
+    results = [build_call_log(number, result) for number, result in zip(phone_numbers, call_results)]
+    await save_call_logs_many(results)
+    
+    if read_error:
+        return ORJSONResponse({
+            "success": False,
+            "error": read_error,
+            "total": len(phone_numbers),
+            "results": results
+        })
     
-    return JSONResponse({
+    return ORJSONResponse({
         "success": True,
         "total": len(phone_numbers),
         "results": results
@@ -395,61 +860,52 @@ async def handle_ai_command(
     numbers: str = Form(None)
 ):
     """Handle AI-based commands"""
-    parsed = parse_ai_command(command)
+    parsed = await parse_ai_command(command)
     
     if parsed["action"] == "call_single":
         number = parsed.get("number")
         if number:
-            result = make_twilio_call(number)
-            call_log = {
-                "number": number,
-                "status": result.get("status", "failed"),
-                "success": result.get("success", False),
-                "timestamp": datetime.now().isoformat(),
-                "call_sid": result.get("call_sid"),
-                "error": result.get("error")
-            }
-            save_call_log(call_log)
-            return JSONResponse({
+            # Use the same E.164 form as /call so the dedupe window is shared
+            number = format_phone_number(
+                str(number), _verified_cache["digit_set"], _verified_cache["digit_map"]
+            ) or str(number)
+            prune_recent_dialed()
+            result = await call_unless_recent(number, make_twilio_call_async)
+            call_log = build_call_log(number, result)
+            await save_call_log(call_log)
+            return ORJSONResponse({
                 "success": True,
                 "action": "call_single",
                 "result": call_log
             })
         else:
-            return JSONResponse({
+            return ORJSONResponse({
                 "success": False,
                 "error": "No phone number found in command"
             })
     
     elif parsed["action"] == "call_all":
         if not numbers:
-            return JSONResponse({
+            return ORJSONResponse({
                 "success": False,
                 "error": "No phone numbers available to call"
             })
         
-        phone_numbers = parse_phone_numbers(numbers)
+        # Drop repeated numbers, keeping the first occurrence's order
+        phone_numbers = list(dict.fromkeys(parse_phone_numbers(numbers)))
         if not phone_numbers:
-            return JSONResponse({
+            return ORJSONResponse({
                 "success": False,
                 "error": "No valid phone numbers found"
             })
         
-        results = []
-        for number in phone_numbers:
-            result = make_twilio_call(number)
-            call_log = {
-                "number": number,
-                "status": result.get("status", "failed"),
-                "success": result.get("success", False),
-                "timestamp": datetime.now().isoformat(),
-                "call_sid": result.get("call_sid"),
-                "error": result.get("error")
-            }
-            save_call_log(call_log)
-            results.append(call_log)
+        # Dispatch all calls concurrently
+        prune_recent_dialed()
+        call_results = await asyncio.gather(*(call_unless_recent(n, make_twilio_call_async) for n in phone_numbers))
+        results = [build_call_log(number, result) for number, result in zip(phone_numbers, call_results)]
+        await save_call_logs_many(results)
         
-        return JSONResponse({
+        return ORJSONResponse({
             "success": True,
             "action": "call_all",
             "total": len(phone_numbers),
@@ -457,39 +913,85 @@ async def handle_ai_command(
         })
     
     else:
-        return JSONResponse({
+        return ORJSONResponse({
             "success": False,
             "error": parsed.get("error", "Unknown command"),
             "parsed": parsed
         })
 
 @app.get("/api/logs")
-async def get_logs():
-    """API endpoint to get call logs"""
+async def get_logs(request: Request, pretty: bool = False):
+    """API endpoint to get call logs (?pretty=1 for indented output)"""
+    etag = call_logs_etag()
+    if etag_matches(request, etag):
+        return Response(status_code=304, headers={"ETag": etag})
     logs = load_call_logs()
-    return JSONResponse({"logs": logs})
+    headers = {
+        "ETag": etag,
+        "Cache-Control": "private, must-revalidate"
+    }
+    if pretty:
+        # Logs are stored compact; indent only when a human asks for it
+        return Response(
+            orjson.dumps({"logs": logs}, option=orjson.OPT_INDENT_2),
+            media_type="application/json",
+            headers=headers
+        )
+    return ORJSONResponse({"logs": logs}, headers=headers)
 
 @app.post("/api/cleanup-logs")
 async def cleanup_logs_endpoint():
     """API endpoint to clean up all error messages in logs"""
     try:
-        count = cleanup_all_logs()
-        return JSONResponse({
+        count = await cleanup_all_logs()
+        return ORJSONResponse({
             "success": True,
             "message": f"Cleaned up {count} log entries",
             "count": count
         })
     except Exception as e:
-        return JSONResponse({
+        return ORJSONResponse({
+            "success": False,
+            "error": str(e)
+        }, status_code=500)
+
+@app.post("/api/compact-logs")
+async def compact_logs_endpoint():
+    """API endpoint to write the call log out as a calls.json snapshot"""
+    try:
+        count = await asyncio.to_thread(compact_call_logs)
+        return ORJSONResponse({
+            "success": True,
+            "message": f"Compacted {count} log entries into {CALLS_JSON}",
+            "count": count
+        })
+    except Exception as e:
+        return ORJSONResponse({
             "success": False,
             "error": str(e)
         }, status_code=500)
 
+@app.post("/api/refresh-verified")
+async def refresh_verified_endpoint():
+    """API endpoint to refetch the cached verified numbers from Twilio"""
+    try:
+        verified = await refresh_verified_cache()
+        return ORJSONResponse({
+            "success": True,
+            "count": len(verified["numbers"]),
+            "verified_numbers": verified["numbers"]
+        })
+    except Exception as e:
+        return ORJSONResponse({
+            "success": False,
+            "error": str(e) or type(e).__name__
+        }, status_code=500)
+
 @app.get("/api/check-verification/{phone_number}")
 async def check_verification(phone_number: str):
     """Check if a phone number is verified in Twilio"""
-    if not twilio_client:
-        return JSONResponse({
+    if not twilio_configured:
+        return ORJSONResponse({
             "success": False,
             "error": "Twilio credentials not configured"
         })
@@ -503,17 +1005,19 @@ async def check_verification(phone_number: str):
             elif len(cleaned_number) == 11 and cleaned_number.startswith('1'):
                 cleaned_number = '+' + cleaned_number
         
-        # Try to fetch verified caller IDs
-        verified_numbers = twilio_client.outgoing_caller_ids.list()
-        verified_phone_numbers = [str(v.phone_number) for v in verified_numbers]
+        # Verified caller IDs come from the background-refreshed cache; if the
+        # last refresh failed the list may be stale, so report the failure
+        if _verified_cache["error"]:
+            raise Exception(f"Could not load verified numbers from Twilio: {_verified_cache['error']}")
+        verified_phone_numbers = _verified_cache["numbers"]
         
         # Normalize for comparison (remove spaces, dashes, etc.)
-        normalized_verified = [re.sub(r'[^\d+]', '', v) for v in verified_phone_numbers]
-        normalized_check = re.sub(r'[^\d+]', '', cleaned_number)
+        normalized_verified = [v.translate(_KEEP_DIGITS_PLUS) for v in verified_phone_numbers]
+        normalized_check = cleaned_number.translate(_KEEP_DIGITS_PLUS)
         
         is_verified = normalized_check in normalized_verified
         
-        return JSONResponse({
+        return ORJSONResponse({
             "success": True,
             "phone_number": cleaned_number,
             "is_verified": is_verified,
@@ -521,7 +1025,7 @@ async def check_verification(phone_number: str):
             "message": "Verified" if is_verified else f"Number {cleaned_number} is NOT verified. Please verify it in Twilio Console."
         })
     except Exception as e:
-        return JSONResponse({
+        return ORJSONResponse({
             "success": False,
             "error": str(e),
             "phone_number": phone_number